@@ -1,8 +1,18 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from ..services import runner_client
 from .routes import router as api_router
 
-app = FastAPI(title="Cross-Run Context API", version="0.1.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await runner_client.aclose()
+
+
+app = FastAPI(title="Cross-Run Context API", version="0.1.0", lifespan=lifespan)
 
 app.include_router(api_router)
 
@@ -1,15 +1,18 @@
+import asyncio
+import hashlib
 import json
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ... import repositories
 from ...models import Artifact, Run, Step
 from ...schemas import ArtifactRead, MachineSummary, RunError, RunRead, StepRead, WorkspaceFile, WorkspaceFileListing
+from ...services import run_service
 from ..deps import db_session
-from ...events import run_events
+from ...events import run_events, run_progress
 
 router = APIRouter()
 
@@ -85,7 +88,7 @@ async def _run_to_read(run: Run, session: AsyncSession, include_artifacts: bool
         created_at=run.created_at,
         status=run.status,
         task_type=task_type,
-        progress=getattr(run, "progress", 0),
+        progress=run_progress.get(run.id, getattr(run, "progress", 0)),
         had_errors=getattr(run, "had_errors", False),
         errors=errors,
         artifacts=artifacts,
@@ -136,11 +139,58 @@ async def list_runs(
 
 
 @router.get("/{run_id}", response_model=RunRead)
-async def get_run(run_id: str, session: AsyncSession = Depends(db_session)) -> RunRead:
+async def get_run(
+    run_id: str,
+    request: Request,
+    session: AsyncSession = Depends(db_session),
+) -> Response:
     run = await repositories.runs.get_run(session, run_id)
     if not run:
         raise HTTPException(status_code=404, detail="Run not found.")
     # For single run view, include all artifacts
+    body = (await _run_to_read(run, session, include_artifacts=True)).model_dump_json().encode()
+    # Pollers send the last ETag back and get an empty 304 while nothing has changed
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.get("/{run_id}/wait", response_model=RunRead)
+async def wait_for_run(
+    run_id: str,
+    timeout: float = Query(30.0, ge=0, le=120),
+    session: AsyncSession = Depends(db_session),
+) -> RunRead:
+    """Long-poll: return the run once it reaches a final status, or after ``timeout`` seconds."""
+    # Subscribe before reading so a status change between the read and the wait isn't missed
+    queue = await run_events.subscribe(run_id)
+    try:
+        run = await repositories.runs.get_run(session, run_id)
+        if not run:
+            raise HTTPException(status_code=404, detail="Run not found.")
+        if run.status not in run_service.FINAL_STATUSES:
+            # Don't hold the connection while waiting
+            await session.commit()
+
+            async def final_status() -> None:
+                while True:
+                    event = await queue.get()
+                    if event.get("type") == "cancelled":
+                        return
+                    if event.get("type") != "status":
+                        continue
+                    if event.get("status") in run_service.FINAL_STATUSES:
+                        return
+
+            try:
+                await asyncio.wait_for(final_status(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            await session.refresh(run)
+    finally:
+        await run_events.unsubscribe(run_id, queue)
     return await _run_to_read(run, session, include_artifacts=True)
 
 
@@ -295,8 +345,6 @@ async def list_workspace_files(
     session: AsyncSession = Depends(db_session),
 ) -> WorkspaceFileListing:
     """List files in run workspace."""
-    from ...services import run_service
-
     run = await repositories.runs.get_run(session, run_id)
     if not run:
         raise HTTPException(status_code=404, detail="Run not found")
@@ -306,30 +354,20 @@ async def list_workspace_files(
     if not workspace.exists():
         return WorkspaceFileListing(run_id=run_id, total_files=0, files=[])
 
-    files = []
-    for path in workspace.rglob("*"):
-        if path.is_file():
-            rel_path = path.relative_to(workspace)
-            # Skip .git internals
-            if str(rel_path).startswith(".git/"):
-                continue
-
-            # Guess file type from extension
-            file_type = _guess_file_type(path)
-
-            files.append(
-                WorkspaceFile(
-                    path=str(rel_path),
-                    size_bytes=path.stat().st_size,
-                    type=file_type,
-                )
-            )
-
-    sorted_files = sorted(files, key=lambda f: f.path)
+    # Same pruned walk the run uses; .git internals are never descended into
+    entries = await asyncio.to_thread(run_service._collect_workspace_files, workspace)
+    files = [
+        WorkspaceFile(
+            path=entry["path"],
+            size_bytes=entry["size"],
+            type=_guess_file_type(Path(entry["path"])),
+        )
+        for entry in entries
+    ]
     return WorkspaceFileListing(
         run_id=run_id,
-        total_files=len(sorted_files),
-        files=sorted_files,
+        total_files=len(files),
+        files=files,
     )
 
 
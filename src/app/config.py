@@ -19,6 +19,8 @@ class Settings(BaseSettings):
     pattern_summary_chars: int = 250
     openai_api_key: str | None = Field(default=None, alias="OPENAI_API_KEY")
     require_git_repo: bool = False
+    clone_workers: int = 8
+    clone_hardlinks: bool = False
 
     class Config:
         env_prefix = "CROSS_RUN_"
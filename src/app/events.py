@@ -1,6 +1,6 @@
 import asyncio
 from collections import defaultdict
-from typing import Any, Dict, Set
+from typing import Any, Dict, Iterable, Optional, Set
 
 
 class RunEventBroker:
@@ -31,5 +31,33 @@ class RunEventBroker:
         for queue in targets:
             await queue.put(event)
 
+    async def publish_many(self, run_id: str, events: Iterable[Dict[str, Any]]) -> None:
+        """Publish several events in order with a single subscriber lookup."""
+        events = list(events)
+        if not events:
+            return
+        async with self._lock:
+            targets = list(self._queues.get(run_id, []))
+        for queue in targets:
+            for event in events:
+                await queue.put(event)
+
+
+class RunProgressStore:
+    """In-memory progress of in-flight runs, kept beside the event stream it feeds."""
+
+    def __init__(self) -> None:
+        self._progress: Dict[str, int] = {}
+
+    def set(self, run_id: str, percent: int) -> None:
+        self._progress[run_id] = percent
+
+    def get(self, run_id: str, default: Optional[int] = None) -> Optional[int]:
+        return self._progress.get(run_id, default)
+
+    def pop(self, run_id: str) -> Optional[int]:
+        return self._progress.pop(run_id, None)
+
 
 run_events = RunEventBroker()
+run_progress = RunProgressStore()
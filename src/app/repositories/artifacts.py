@@ -1,4 +1,6 @@
-from sqlalchemy import select
+from typing import Any
+
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import Artifact
@@ -17,6 +19,12 @@ async def add_artifact(session: AsyncSession, artifact: Artifact) -> Artifact:
     return artifact
 
 
+async def add_artifacts(session: AsyncSession, rows: list[dict[str, Any]]) -> None:
+    """Insert several artifacts, given as column dicts with the same keys, in one executemany."""
+    if rows:
+        await session.execute(insert(Artifact), rows)
+
+
 async def get_artifact_by_kind(
     session: AsyncSession,
     run_id: str,
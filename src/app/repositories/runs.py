@@ -1,7 +1,10 @@
-from sqlalchemy import select, update
+from typing import Any
+
+from sqlalchemy import case, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import Run
+from ..utils import json_dumps
 
 
 async def list_runs(session: AsyncSession, project_id: str | None = None) -> list[Run]:
@@ -46,6 +49,26 @@ async def update_run_errors(
     )
 
 
+async def append_run_error(session: AsyncSession, run_id: str, error_record: dict[str, Any]) -> None:
+    """Append an error record to errors_json in place and mark the run as having errors."""
+    # Missing or malformed histories start over as an empty array, as before
+    existing = case(
+        (
+            func.json_valid(Run.errors_json) == 1,
+            case((func.json_type(Run.errors_json) == "array", Run.errors_json), else_="[]"),
+        ),
+        else_="[]",
+    )
+    await session.execute(
+        update(Run)
+        .where(Run.id == run_id)
+        .values(
+            had_errors=True,
+            errors_json=func.json_insert(existing, "$[#]", func.json(json_dumps(error_record))),
+        )
+    )
+
+
 async def update_run_summary(session: AsyncSession, run_id: str, machine_summary_json: str) -> None:
     """Update run machine summary."""
     await session.execute(
@@ -1,4 +1,6 @@
-from sqlalchemy import select
+from typing import Any
+
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import Step
@@ -13,3 +15,9 @@ async def record_step(session: AsyncSession, step: Step) -> Step:
     session.add(step)
     await session.flush()
     return step
+
+
+async def record_steps(session: AsyncSession, rows: list[dict[str, Any]]) -> None:
+    """Insert several steps, given as column dicts with the same keys, in one executemany."""
+    if rows:
+        await session.execute(insert(Step), rows)
@@ -1,11 +1,11 @@
-from datetime import datetime
+import time
 from typing import Any
 
 from pydantic import BaseModel, Field
 
 
 def utc_now_iso() -> str:
-    return datetime.utcnow().isoformat(timespec="seconds") + "Z"
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
 
 class ProjectCreate(BaseModel):
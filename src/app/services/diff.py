@@ -65,6 +65,9 @@ def collect_git_diff_summary(workspace: Path) -> dict | None:
     }
 
 
-def write_diff_artifact(path: Path, diff_summary: dict) -> None:
+def write_diff_artifact(path: Path, diff_summary: dict) -> int:
+    """Write the diff summary as JSON and return the number of bytes written."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(diff_summary, indent=2), encoding="utf-8")
+    data = json.dumps(diff_summary, indent=2).encode("utf-8")
+    path.write_bytes(data)
+    return len(data)
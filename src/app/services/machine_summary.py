@@ -10,13 +10,31 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from ..models import Artifact, Run, Step
+from ..utils import json_loads
+
+try:
+    import ijson  # type: ignore
+except ImportError:
+    ijson = None
 
 logger = logging.getLogger(__name__)
 
+# Below this size a full parse is cheaper than ijson's per-event overhead
+_STREAM_PARSE_MIN_CHARS = 4096
+
+# Failure classification keywords, checked in priority order
+_ERROR_KEYWORDS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("permission_error", ("permission", "denied")),
+    ("missing_dependency", ("not found", "missing")),
+    ("timeout", ("timeout",)),
+)
+
 
 def generate_machine_summary(
     run: Run,
@@ -72,13 +90,16 @@ def _extract_goal(system_instructions: str) -> str:
 
     # System instructions format: [pattern_block] + base_prompt + user_prompt
     # User prompt is the last meaningful paragraph
-    lines = system_instructions.strip().split("\n")
-
-    # Work backwards to find user's actual request
-    for i in range(len(lines) - 1, -1, -1):
-        line = lines[i].strip()
-        if line and not line.startswith("<") and not line.startswith("You are"):
+    text = system_instructions.strip()
+
+    # Work backwards line by line to find user's actual request
+    end = len(text)
+    while end >= 0:
+        start = text.rfind("\n", 0, end) + 1
+        line = text[start:end].strip()
+        if line and not line.startswith(("<", "You are")):
             return line
+        end = start - 1
 
     return system_instructions[:200]  # Fallback: first 200 chars
 
@@ -105,11 +126,6 @@ def _identify_artifacts(
         if a.kind not in ("codex-jsonl", "diff-summary")
     ]
 
-    # If no content artifacts, look for actual workspace files
-    workspace_files = []
-    if workspace_path.exists():
-        workspace_files = _list_workspace_outputs(workspace_path)
-
     # Primary artifact heuristics:
     # 1. First markdown file (common output format)
     # 2. First workspace file that's not a log
@@ -119,58 +135,72 @@ def _identify_artifacts(
     secondary = []
 
     # Check content artifacts first
+    workspace_prefix = os.path.join(os.path.normpath(workspace_path), "")
     markdown_artifacts = [a for a in content_artifacts if a.kind == "markdown"]
     if markdown_artifacts:
-        primary = _relative_path(markdown_artifacts[0].path, workspace_path)
-        secondary = [_relative_path(a.path, workspace_path) for a in content_artifacts[1:]]
+        primary = _relative_path(markdown_artifacts[0].path, workspace_prefix)
+        secondary = [_relative_path(a.path, workspace_prefix) for a in content_artifacts[1:6]]
     elif content_artifacts:
-        primary = _relative_path(content_artifacts[0].path, workspace_path)
-        secondary = [_relative_path(a.path, workspace_path) for a in content_artifacts[1:]]
+        primary = _relative_path(content_artifacts[0].path, workspace_prefix)
+        secondary = [_relative_path(a.path, workspace_prefix) for a in content_artifacts[1:6]]
 
-    # Check workspace files
-    elif workspace_files:
-        primary = workspace_files[0]
-        secondary = workspace_files[1:]
+    # If no content artifacts, look for actual workspace files
+    elif workspace_path.exists():
+        workspace_files = list(islice(_iter_workspace_outputs(workspace_path), 10))
+        if workspace_files:
+            primary = workspace_files[0]
+            secondary = workspace_files[1:]
 
     return primary, secondary[:5]  # Limit to 5 secondary artifacts
 
 
-def _list_workspace_outputs(workspace_path: Path) -> list[str]:
-    """List notable output files in workspace."""
-    outputs = []
+# Common output patterns
+_OUTPUT_EXTENSIONS = frozenset({".md", ".txt", ".html", ".pdf", ".docx", ".csv", ".json"})
 
-    # Common output patterns
-    output_extensions = {".md", ".txt", ".html", ".pdf", ".docx", ".csv", ".json"}
 
-    for file_path in workspace_path.rglob("*"):
-        if not file_path.is_file():
-            continue
-
-        rel_path = file_path.relative_to(workspace_path)
+def _iter_workspace_outputs(workspace_path: str | Path, prefix: str = "") -> Iterator[str]:
+    """
+    Yield notable output files in workspace, in sorted relative-path order.
 
-        # Skip .git internals
-        if str(rel_path).startswith(".git/"):
+    Siblings are visited sorted by name (directories keyed as ``name/``), so the
+    depth-first walk yields paths in the same order as sorting the full list and
+    callers can stop consuming early without walking the rest of the tree.
+    """
+    try:
+        with os.scandir(workspace_path) as it:
+            entries = [
+                (entry.name + "/" if entry.is_dir(follow_symlinks=False) else entry.name, entry)
+                for entry in it
+            ]
+    except OSError:
+        return
+    entries.sort(key=lambda item: item[0])
+
+    for key, entry in entries:
+        if key.endswith("/"):
+            # Skip .git internals
+            if entry.name != ".git":
+                yield from _iter_workspace_outputs(entry.path, prefix + key)
             continue
 
         # Skip hidden files
-        if file_path.name.startswith("."):
+        if entry.name.startswith("."):
             continue
 
         # Include files with output-like extensions
-        if file_path.suffix in output_extensions:
-            outputs.append(str(rel_path))
+        if os.path.splitext(entry.name)[1] in _OUTPUT_EXTENSIONS and entry.is_file():
+            yield prefix + entry.name
 
-    return sorted(outputs)[:10]  # Limit to 10 files
 
+def _relative_path(absolute_path: str, workspace_prefix: str) -> str:
+    """
+    Convert absolute artifact path to workspace-relative path.
 
-def _relative_path(absolute_path: str, workspace_path: Path) -> str:
-    """Convert absolute artifact path to workspace-relative path."""
-    try:
-        path = Path(absolute_path)
-        if path.is_relative_to(workspace_path):
-            return str(path.relative_to(workspace_path))
-    except (ValueError, OSError):
-        pass
+    ``workspace_prefix`` is the normalized workspace path with a trailing separator.
+    """
+    path = os.path.normpath(absolute_path)
+    if path.startswith(workspace_prefix):
+        return path[len(workspace_prefix):]
     return absolute_path
 
 
@@ -202,18 +232,16 @@ def _analyze_failure(run: Run, steps: list[Step]) -> tuple[str | None, str | Non
 
         if last_failure.outcome_notes_json:
             try:
-                notes = json.loads(last_failure.outcome_notes_json)
+                notes = json_loads(last_failure.outcome_notes_json)
                 if isinstance(notes, list) and notes:
                     notes_text = "; ".join(str(n) for n in notes)
 
                     # Classify error type
                     notes_lower = notes_text.lower()
-                    if "permission" in notes_lower or "denied" in notes_lower:
-                        error_type = "permission_error"
-                    elif "not found" in notes_lower or "missing" in notes_lower:
-                        error_type = "missing_dependency"
-                    elif "timeout" in notes_lower:
-                        error_type = "timeout"
+                    for keyword_type, keywords in _ERROR_KEYWORDS:
+                        if any(keyword in notes_lower for keyword in keywords):
+                            error_type = keyword_type
+                            break
             except (json.JSONDecodeError, TypeError):
                 pass
 
@@ -221,13 +249,60 @@ def _analyze_failure(run: Run, steps: list[Step]) -> tuple[str | None, str | Non
 
     # Check for errors in run.errors_json
     if run.errors_json:
-        try:
-            errors = json.loads(run.errors_json)
-            if errors and isinstance(errors, list):
-                first_error = errors[0]
-                return first_error.get("error_type", "unknown_error"), first_error.get("message")
-        except (json.JSONDecodeError, TypeError):
-            pass
+        first_error = _first_list_item(run.errors_json)
+        if isinstance(first_error, dict):
+            return first_error.get("error_type", "unknown_error"), first_error.get("message")
 
     # Generic failure
     return "execution_error", "Run failed without specific error details"
+
+
+def _first_list_item(payload: str) -> Any:
+    """
+    Return the first element of a JSON array, or None.
+
+    Large payloads are stream-parsed with ijson (when installed) so only the
+    first element is materialized. The rest of the document is still read, so
+    anything the full parse rejects returns None here too.
+    """
+    if ijson is not None and len(payload) >= _STREAM_PARSE_MIN_CHARS:
+        try:
+            return _stream_first_list_item(payload)
+        except ijson.JSONError:
+            return None
+
+    try:
+        items = json_loads(payload)
+    except (json.JSONDecodeError, TypeError):
+        return None
+    if isinstance(items, list) and items:
+        return items[0]
+    return None
+
+
+def _stream_first_list_item(payload: str) -> Any:
+    events = ijson.parse(payload.encode("utf-8"), use_float=True)
+    _, event, _ = next(events, (None, None, None))
+    if event != "start_array":
+        # Drain so a malformed document raises, as the full parse would
+        for _ in events:
+            pass
+        return None
+
+    builder = ijson.ObjectBuilder()
+    first: Any = None
+    depth = 0
+    for _, event, value in events:
+        if depth == 0 and event == "end_array":
+            break
+        builder.event(event, value)
+        if event in ("start_map", "start_array"):
+            depth += 1
+        elif event in ("end_map", "end_array"):
+            depth -= 1
+        if depth == 0:
+            first = builder.value
+            break
+    for _ in events:
+        pass
+    return first
@@ -1,46 +1,126 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections import OrderedDict
 from typing import Any
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
 
 from .. import repositories
 from ..domains import get_domain_config
 from ..events import run_events
 from ..models import PatternCache
 from ..services import patterns as pattern_service
-from ..services.patterns.extractors import get_extractor
+from ..services.patterns.extractors import get_extractor_instance
 
 logger = logging.getLogger(__name__)
 
+# Decoded patterns by source run id, least recently used first. Only committed
+# PatternCache rows are memoized: cache hits from other transactions go in directly,
+# and patterns saved by a session wait in its info dict until that session commits.
+# Committed rows are never deleted, so entries need no expiry.
+_PATTERN_MEMO_SIZE = 256
+_PENDING_PATTERNS_KEY = "pattern_agent.pending_patterns"
+_pattern_memo: OrderedDict[str, pattern_service.Pattern] = OrderedDict()
+_pattern_inflight: dict[str, asyncio.Future[pattern_service.Pattern | None]] = {}
+
+
+def _remember_pattern(run_id: str, pattern: pattern_service.Pattern) -> None:
+    _pattern_memo[run_id] = pattern
+    _pattern_memo.move_to_end(run_id)
+    if len(_pattern_memo) > _PATTERN_MEMO_SIZE:
+        _pattern_memo.popitem(last=False)
+
+
+def _pending_patterns(session: AsyncSession | Session) -> dict[str, pattern_service.Pattern]:
+    return session.info.setdefault(_PENDING_PATTERNS_KEY, {})
+
+
+@event.listens_for(Session, "after_commit")
+def _remember_committed_patterns(session: Session) -> None:
+    for run_id, pattern in session.info.pop(_PENDING_PATTERNS_KEY, {}).items():
+        _remember_pattern(run_id, pattern)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _forget_uncommitted_patterns(session: Session, transaction: SessionTransaction) -> None:
+    # Runs after after_commit, so anything left here was rolled back or discarded.
+    if transaction.parent is None:
+        session.info.pop(_PENDING_PATTERNS_KEY, None)
+
 
 async def fetch_pattern(session: AsyncSession, run_id: str) -> pattern_service.Pattern | None:
     """Ensure a pattern is cached for the given run and return it."""
+    pattern = _pattern_memo.get(run_id)
+    if pattern is not None:
+        _pattern_memo.move_to_end(run_id)
+        return pattern
+
+    # Concurrent requests for the same run share one lookup when it finds a committed
+    # row. If the lookup fails, or its result only exists in the loading session's
+    # transaction, each waiter loads the pattern on its own session instead.
+    inflight = _pattern_inflight.get(run_id)
+    if inflight is not None:
+        await asyncio.wait([inflight])
+        if not inflight.cancelled():
+            return inflight.result()
+        pattern, _ = await _load_pattern(session, run_id)
+        return pattern
+
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[pattern_service.Pattern | None] = loop.create_future()
+    _pattern_inflight[run_id] = future
+    try:
+        pattern, committed = await _load_pattern(session, run_id)
+    except BaseException:
+        future.cancel()
+        raise
+    else:
+        if committed:
+            future.set_result(pattern)
+        else:
+            future.cancel()
+        return pattern
+    finally:
+        del _pattern_inflight[run_id]
+
+
+async def _load_pattern(
+    session: AsyncSession, run_id: str
+) -> tuple[pattern_service.Pattern | None, bool]:
+    """Load or extract the pattern, and say whether it comes from a committed row."""
+    pending = _pending_patterns(session)
     cache = await repositories.patterns.get_cached_pattern(session, run_id)
     if cache:
-        return pattern_service.pattern_from_cache(cache)
+        if run_id in pending:
+            return pending[run_id], False
+        pattern = pattern_service.pattern_from_cache(cache)
+        _remember_pattern(run_id, pattern)
+        return pattern, True
 
     run = await repositories.runs.get_run(session, run_id)
     if not run:
-        return None
+        return None, False
 
     steps = await repositories.steps.list_steps_for_run(session, run_id)
     if not steps:
-        return None
+        return None, False
 
-    project = run.project or await repositories.projects.get_project(session, run.project_id)
+    project = await repositories.projects.get_project(session, run.project_id)
     if not project:
-        return None
+        return None, False
 
     domain_config = get_domain_config(project.task_type)
-    extractor_class = get_extractor(domain_config.pattern_extractor)
-    extractor = extractor_class()
+    extractor = get_extractor_instance(domain_config.pattern_extractor)
 
     pattern = pattern_service.extract_pattern_from_steps(run_id, steps, extractor)
     payload = pattern_service.pattern_to_cache_payload(pattern)
     cache_model = PatternCache(**payload)
     await repositories.patterns.save_pattern_cache(session, cache_model)
+    pending[run_id] = pattern
 
     event_payload: dict[str, Any] = {
         "type": "pattern",
@@ -51,4 +131,4 @@ async def fetch_pattern(session: AsyncSession, run_id: str) -> pattern_service.P
         "variables": list(pattern.variables.keys()),
     }
     await run_events.publish(run_id, event_payload)
-    return pattern
+    return pattern, False
@@ -1,22 +1,22 @@
 from __future__ import annotations
 
-import json
-import math
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any, Iterable
 
 from ...config import settings
 from ...models import PatternCache, Step
-from .extractors import BasePatternExtractor, CodeExtractor, get_extractor
+from ...utils import json_dumps, json_loads
+from .extractors import BasePatternExtractor, get_extractor_instance
 
 
-@dataclass
+@dataclass(slots=True)
 class PatternStep:
     instruction: str
     intent: dict[str, Any] | None = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class Pattern:
     id: str
     source_run_id: str
@@ -25,13 +25,18 @@ class Pattern:
     steps: list[PatternStep]
     variables: dict[str, Any]
 
+    @cached_property
+    def steps_payload(self) -> list[dict[str, Any]]:
+        """Step dicts for serialization, built on first use (steps are final by then)."""
+        return [{"instruction": step.instruction, "intent": step.intent} for step in self.steps]
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "id": self.id,
             "source_run_id": self.source_run_id,
             "name": self.name,
             "summary": self.summary,
-            "steps": [step.__dict__ for step in self.steps],
+            "steps": self.steps_payload,
             "variables": self.variables,
         }
 
@@ -51,7 +56,7 @@ def extract_pattern_from_steps(
         Extracted Pattern object
     """
     if extractor is None:
-        extractor = CodeExtractor()
+        extractor = get_extractor_instance("CodeExtractor")
     usable_steps: list[PatternStep] = []
     variables: dict[str, Any] = {}
     instructions: list[str] = []
@@ -62,10 +67,11 @@ def extract_pattern_from_steps(
         normalized = extractor.normalize_instruction(step.content or "")
         if not normalized:
             continue
-        extractor.discover_variables(normalized, variables)
         usable_steps.append(PatternStep(instruction=normalized))
         instructions.append(normalized)
 
+    extractor.discover_variables_bulk(instructions, variables)
+
     usable_steps = usable_steps[: settings.max_pattern_steps]
     instructions = instructions[: settings.max_pattern_steps]
 
@@ -85,42 +91,53 @@ def extract_pattern_from_steps(
     return pattern
 
 
-def _clamp_pattern_tokens(pattern: Pattern) -> None:
-    def estimate_tokens(text: str) -> int:
-        return math.ceil(len(text.split()))
+def _estimate_tokens(text: str) -> int:
+    return len(text.split())
 
-    while pattern.steps:
-        block = render_pattern_block(pattern)
-        if estimate_tokens(block) <= settings.max_pattern_tokens:
-            break
+
+def _clamp_pattern_tokens(pattern: Pattern) -> None:
+    # Render once, then drop trailing steps by subtracting their token counts.
+    # Step lines are newline-separated, so the block's count is their sum plus the rest.
+    total = _estimate_tokens(render_pattern_block(pattern))
+    step_tokens = [
+        _estimate_tokens(f"{idx}. {step.instruction}")
+        for idx, step in enumerate(pattern.steps, start=1)
+    ]
+    while pattern.steps and total > settings.max_pattern_tokens:
+        total -= step_tokens.pop()
         pattern.steps.pop()
 
 
+_PATTERN_BLOCK_FOOTER = (
+    "Apply the same sequence when it fits. If critical context is missing, ask once, "
+    "then continue with the user's goal.\n"
+    "</reference_workflow>"
+)
+
+
 def render_pattern_block(pattern: Pattern) -> str:
-    lines = [f'<reference_workflow id="{pattern.id}">']
     summary = pattern.summary or "Follow the proven approach from the reference run."
-    lines.append(f"What worked before: {summary}")
-    lines.append("")
-    lines.append("Sequence:")
-    if pattern.steps:
-        for idx, step in enumerate(pattern.steps, start=1):
-            lines.append(f"{idx}. {step.instruction}")
-    else:
-        lines.append("No reusable steps captured.")
-    lines.append("")
-    lines.append("Variables:")
-    if pattern.variables:
-        for key, payload in pattern.variables.items():
-            lines.append(f"- {key}: {payload.get('type','text')} (ex: {payload.get('example','?')})")
-    else:
-        lines.append("- none discovered")
-    lines.append("")
-    lines.append(
-        "Apply the same sequence when it fits. If critical context is missing, ask once, "
-        "then continue with the user's goal."
+    steps_block = (
+        "\n".join(f"{idx}. {step.instruction}" for idx, step in enumerate(pattern.steps, start=1))
+        or "No reusable steps captured."
+    )
+    variables_block = (
+        "\n".join(
+            f"- {key}: {payload.get('type','text')} (ex: {payload.get('example','?')})"
+            for key, payload in pattern.variables.items()
+        )
+        or "- none discovered"
+    )
+    return (
+        f'<reference_workflow id="{pattern.id}">\n'
+        f"What worked before: {summary}\n"
+        "\n"
+        f"Sequence:\n{steps_block}\n"
+        "\n"
+        f"Variables:\n{variables_block}\n"
+        "\n"
+        f"{_PATTERN_BLOCK_FOOTER}"
     )
-    lines.append("</reference_workflow>")
-    return "\n".join(lines)
 
 
 def pattern_to_cache_payload(pattern: Pattern) -> dict[str, str]:
@@ -129,15 +146,15 @@ def pattern_to_cache_payload(pattern: Pattern) -> dict[str, str]:
         "source_run_id": pattern.source_run_id,
         "name": pattern.name,
         "summary": pattern.summary,
-        "steps_json": json.dumps([step.__dict__ for step in pattern.steps]),
-        "variables_json": json.dumps(pattern.variables),
+        "steps_json": json_dumps(pattern.steps_payload),
+        "variables_json": json_dumps(pattern.variables),
     }
 
 
 def pattern_from_cache(cache: PatternCache) -> Pattern:
-    steps_payload = json.loads(cache.steps_json)
+    steps_payload = json_loads(cache.steps_json)
     steps = [PatternStep(**step_dict) for step_dict in steps_payload]
-    variables = json.loads(cache.variables_json)
+    variables = json_loads(cache.variables_json)
     return Pattern(
         id=cache.id,
         source_run_id=cache.source_run_id,
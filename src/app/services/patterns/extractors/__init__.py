@@ -29,3 +29,12 @@ EXTRACTOR_REGISTRY = {
 def get_extractor(name: str) -> type[BasePatternExtractor]:
     """Get an extractor class by name."""
     return EXTRACTOR_REGISTRY.get(name, CodeExtractor)
+
+
+# Extractors are stateless, so one shared instance per name is enough
+_EXTRACTOR_INSTANCES = {name: cls() for name, cls in EXTRACTOR_REGISTRY.items()}
+
+
+def get_extractor_instance(name: str) -> BasePatternExtractor:
+    """Get the shared extractor instance by name."""
+    return _EXTRACTOR_INSTANCES.get(name) or _EXTRACTOR_INSTANCES["CodeExtractor"]
@@ -0,0 +1,71 @@
+"""Optional Hyperscan backend for PatternScanner."""
+
+from __future__ import annotations
+
+import logging
+import re
+
+try:
+    import hyperscan  # type: ignore
+except ImportError:
+    hyperscan = None
+
+logger = logging.getLogger(__name__)
+
+# Patterns are compiled in ASCII mode (Unicode property support blows up the
+# start-of-match automata). Python's str ``\s`` also matches \x1c-\x1f, so any text
+# outside printable ASCII plus the usual whitespace goes through ``re`` instead.
+_UNSUPPORTED_TEXT_RE = re.compile(r"[^\x00-\x1b\x20-\x7f]")
+
+
+class HyperscanMatcher:
+    """Locate the leftmost start of each pattern with one Hyperscan database scan."""
+
+    def __init__(self, database: "hyperscan.Database") -> None:
+        self._database = database
+
+    def leftmost_starts(self, text: str) -> dict[int, int] | None:
+        """
+        Return ``{pattern_index: start}`` for every pattern that matches.
+
+        Returns None when the text needs Python's Unicode semantics.
+        """
+        if _UNSUPPORTED_TEXT_RE.search(text):
+            return None
+
+        starts: dict[int, int] = {}
+
+        def on_match(pattern_id: int, start: int, end: int, flags: int, context: object) -> None:
+            # Matches are reported by end offset, so keep the smallest start seen.
+            current = starts.get(pattern_id)
+            if current is None or start < current:
+                starts[pattern_id] = start
+
+        self._database.scan(text.encode("ascii"), match_event_handler=on_match)
+        return starts
+
+
+def compile_matcher(patterns: list[re.Pattern[str]]) -> HyperscanMatcher | None:
+    """Compile patterns into a Hyperscan database, or return None if unavailable."""
+    if hyperscan is None or not patterns:
+        return None
+
+    flags = hyperscan.HS_FLAG_SOM_LEFTMOST
+    extra = patterns[0].flags & ~(re.UNICODE | re.IGNORECASE)
+    if extra:
+        return None
+    if patterns[0].flags & re.IGNORECASE:
+        flags |= hyperscan.HS_FLAG_CASELESS
+
+    database = hyperscan.Database()
+    try:
+        database.compile(
+            expressions=[pattern.pattern.encode("ascii") for pattern in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=[flags] * len(patterns),
+        )
+    except (hyperscan.error, UnicodeEncodeError):
+        logger.warning("Hyperscan could not compile extractor patterns; using re")
+        return None
+    return HyperscanMatcher(database)
@@ -4,9 +4,54 @@ from __future__ import annotations
 
 import re
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Callable
 
 from ....models import Step
+from ._hyperscan import compile_matcher
+
+VariableHandler = Callable[["re.Match[str]", dict[str, Any]], None]
+
+
+class PatternScanner:
+    """
+    Find the first match of several regexes in a text.
+
+    When the optional ``hyperscan`` package is installed, match positions come from a
+    single Hyperscan database scan. Otherwise (or when the text needs Python's Unicode
+    semantics) each pattern is searched on its own. The result for each name is
+    identical to calling ``pattern.search(text)``.
+    """
+
+    def __init__(self, patterns: dict[str, re.Pattern[str]]) -> None:
+        flags = {pattern.flags for pattern in patterns.values()}
+        if len(flags) != 1:
+            raise ValueError("PatternScanner patterns must share the same flags")
+        self._patterns = patterns
+        self._names = list(patterns)
+        self._hyperscan = compile_matcher(list(patterns.values()))
+
+    def first_matches(self, text: str) -> dict[str, re.Match[str]]:
+        """Return the leftmost match per pattern name, in registration order."""
+        positions = self._hyperscan_positions(text)
+        if positions is None:
+            return {
+                name: match
+                for name, pattern in self._patterns.items()
+                if (match := pattern.search(text))
+            }
+        return {
+            name: self._patterns[name].match(text, positions[name])
+            for name in self._patterns
+            if name in positions
+        }
+
+    def _hyperscan_positions(self, text: str) -> dict[str, int] | None:
+        if self._hyperscan is None:
+            return None
+        starts = self._hyperscan.leftmost_starts(text)
+        if starts is None:
+            return None
+        return {self._names[index]: start for index, start in starts.items()}
 
 
 class BasePatternExtractor(ABC):
@@ -23,6 +68,20 @@ class BasePatternExtractor(ABC):
         """
         pass
 
+    def discover_variables_bulk(self, texts: list[str], variables: dict[str, Any]) -> None:
+        """
+        Discover variables across several instruction texts, in order.
+
+        Variables are only ever set once, so a repeated text cannot add anything new
+        and is scanned only the first time it appears.
+        """
+        seen: set[str] = set()
+        for text in texts:
+            if text in seen:
+                continue
+            seen.add(text)
+            self.discover_variables(text, variables)
+
     def normalize_instruction(self, text: str) -> str:
         """
         Normalize instruction text for pattern extraction.
@@ -30,8 +89,7 @@ class BasePatternExtractor(ABC):
         Default implementation: collapse whitespace, limit to 160 chars.
         Override if domain needs different normalization.
         """
-        cleaned = re.sub(r"\s+", " ", text.strip())
-        return cleaned[:160]
+        return " ".join(text.split())[:160]
 
     def should_include_step(self, step: Step) -> bool:
         """
@@ -5,13 +5,47 @@ from __future__ import annotations
 import re
 from typing import Any
 
-from .base import BasePatternExtractor
+from .base import BasePatternExtractor, PatternScanner, VariableHandler
 
 # Code-specific regex patterns
 FILE_RANGE_RE = re.compile(r"(\w+)-(\d+)\s*(?:to|through|:)\s*(\w+)-?(\d+)", re.IGNORECASE)
 SUB_RE = re.compile(r"replace\s+(.+?)\s+with\s+(?:contents\s+from\s+)?(.+)", re.IGNORECASE)
 FILE_REF_RE = re.compile(r"([\w./-]+\.(?:txt|md|csv|json|py|js|ts|go|rs|java))", re.IGNORECASE)
 
+_SCANNER = PatternScanner(
+    {"file_range": FILE_RANGE_RE, "substitution": SUB_RE, "file_ref": FILE_REF_RE}
+)
+
+
+def _file_range(match: re.Match[str], variables: dict[str, Any]) -> None:
+    if "fileRange" in variables:
+        return
+    variables["fileRange"] = {"type": "range", "example": match.group(0)}
+
+
+def _substitution(match: re.Match[str], variables: dict[str, Any]) -> None:
+    if "placeholder" not in variables:
+        placeholder = match.group(1).strip()
+        if placeholder:
+            variables["placeholder"] = {"type": "text", "example": placeholder}
+    if "source" not in variables:
+        source = match.group(2).strip()
+        if source:
+            variables["source"] = {"type": "text", "example": source}
+
+
+def _file_ref(match: re.Match[str], variables: dict[str, Any]) -> None:
+    if "file" in variables:
+        return
+    variables["file"] = {"type": "file", "example": match.group(1)}
+
+
+_HANDLERS: dict[str, VariableHandler] = {
+    "file_range": _file_range,
+    "substitution": _substitution,
+    "file_ref": _file_ref,
+}
+
 
 class CodeExtractor(BasePatternExtractor):
     """Pattern extractor for code development workflows."""
@@ -25,25 +59,5 @@ class CodeExtractor(BasePatternExtractor):
         - Text substitution patterns (e.g., "replace X with Y")
         - File references (various code file extensions)
         """
-        # Extract file range patterns
-        if match := FILE_RANGE_RE.search(text):
-            variables.setdefault(
-                "fileRange",
-                {"type": "range", "example": match.group(0)},
-            )
-
-        # Extract substitution patterns
-        if match := SUB_RE.search(text):
-            placeholder = match.group(1).strip()
-            source = match.group(2).strip()
-            if placeholder:
-                variables.setdefault("placeholder", {"type": "text", "example": placeholder})
-            if source:
-                variables.setdefault("source", {"type": "text", "example": source})
-
-        # Extract file references
-        if match := FILE_REF_RE.search(text):
-            variables.setdefault(
-                "file",
-                {"type": "file", "example": match.group(1)},
-            )
+        for kind, match in _SCANNER.first_matches(text).items():
+            _HANDLERS[kind](match, variables)
@@ -5,7 +5,7 @@ from __future__ import annotations
 import re
 from typing import Any
 
-from .base import BasePatternExtractor
+from .base import BasePatternExtractor, PatternScanner, VariableHandler
 
 # Data analysis regex patterns
 DATAFRAME_OP_RE = re.compile(
@@ -21,6 +21,61 @@ STATISTICAL_RE = re.compile(
 )
 
 
+_SCANNER = PatternScanner(
+    {
+        "dataframe_op": DATAFRAME_OP_RE,
+        "chart_type": CHART_TYPE_RE,
+        "dataset": DATASET_RE,
+        "column": COLUMN_RE,
+        "statistical": STATISTICAL_RE,
+    }
+)
+
+
+def _dataframe_op(match: re.Match[str], variables: dict[str, Any]) -> None:
+    if "data_operation" in variables:
+        return
+    operation = match.group(0).strip()
+    variables["data_operation"] = {"type": "operation", "example": operation}
+
+
+def _chart_type(match: re.Match[str], variables: dict[str, Any]) -> None:
+    if "chart_type" in variables:
+        return
+    chart_type = match.group(1).lower()
+    variables["chart_type"] = {"type": "visualization", "example": f"{chart_type} chart"}
+
+
+def _dataset(match: re.Match[str], variables: dict[str, Any]) -> None:
+    if "dataset" in variables:
+        return
+    dataset = match.group(1).strip()
+    variables["dataset"] = {"type": "file", "example": dataset}
+
+
+def _column(match: re.Match[str], variables: dict[str, Any]) -> None:
+    if "columns" in variables:
+        return
+    columns = match.group(1).strip()
+    variables["columns"] = {"type": "column", "example": columns}
+
+
+def _statistical(match: re.Match[str], variables: dict[str, Any]) -> None:
+    if "statistical_method" in variables:
+        return
+    method = match.group(1).lower()
+    variables["statistical_method"] = {"type": "statistic", "example": method}
+
+
+_HANDLERS: dict[str, VariableHandler] = {
+    "dataframe_op": _dataframe_op,
+    "chart_type": _chart_type,
+    "dataset": _dataset,
+    "column": _column,
+    "statistical": _statistical,
+}
+
+
 class DataExtractor(BasePatternExtractor):
     """Pattern extractor for data analysis workflows."""
 
@@ -35,42 +90,5 @@ class DataExtractor(BasePatternExtractor):
         - Column names
         - Statistical methods
         """
-        # Extract dataframe operations
-        if match := DATAFRAME_OP_RE.search(text):
-            operation = match.group(0).strip()
-            variables.setdefault(
-                "data_operation",
-                {"type": "operation", "example": operation},
-            )
-
-        # Extract chart types
-        if match := CHART_TYPE_RE.search(text):
-            chart_type = match.group(1).lower()
-            variables.setdefault(
-                "chart_type",
-                {"type": "visualization", "example": f"{chart_type} chart"},
-            )
-
-        # Extract dataset references
-        if match := DATASET_RE.search(text):
-            dataset = match.group(1).strip()
-            variables.setdefault(
-                "dataset",
-                {"type": "file", "example": dataset},
-            )
-
-        # Extract column names
-        if match := COLUMN_RE.search(text):
-            columns = match.group(1).strip()
-            variables.setdefault(
-                "columns",
-                {"type": "column", "example": columns},
-            )
-
-        # Extract statistical methods
-        if match := STATISTICAL_RE.search(text):
-            method = match.group(1).lower()
-            variables.setdefault(
-                "statistical_method",
-                {"type": "statistic", "example": method},
-            )
+        for kind, match in _SCANNER.first_matches(text).items():
+            _HANDLERS[kind](match, variables)
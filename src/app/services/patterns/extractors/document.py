@@ -5,7 +5,7 @@ from __future__ import annotations
 import re
 from typing import Any
 
-from .base import BasePatternExtractor
+from .base import BasePatternExtractor, PatternScanner, VariableHandler
 
 # Document processing regex patterns
 FORMAT_CONVERSION_RE = re.compile(
@@ -17,6 +17,63 @@ INPUT_DIR_RE = re.compile(r'(?:input|source)\s+(?:directory|folder):\s*([^\s,]+)
 OUTPUT_DIR_RE = re.compile(r'(?:output|destination)\s+(?:directory|folder):\s*([^\s,]+)', re.IGNORECASE)
 
 
+_SCANNER = PatternScanner(
+    {
+        "format_conversion": FORMAT_CONVERSION_RE,
+        "batch_pattern": BATCH_PATTERN_RE,
+        "template": TEMPLATE_RE,
+        "input_dir": INPUT_DIR_RE,
+        "output_dir": OUTPUT_DIR_RE,
+    }
+)
+
+
+def _format_conversion(match: re.Match[str], variables: dict[str, Any]) -> None:
+    if "source_format" not in variables:
+        source_format = match.group(1).strip()
+        variables["source_format"] = {"type": "format", "example": source_format}
+    if "target_format" not in variables:
+        target_format = match.group(2).strip()
+        variables["target_format"] = {"type": "format", "example": target_format}
+
+
+def _batch_pattern(match: re.Match[str], variables: dict[str, Any]) -> None:
+    if "batch_item" in variables:
+        return
+    item_type = match.group(1).strip()
+    variables["batch_item"] = {"type": "item", "example": item_type}
+
+
+def _template(match: re.Match[str], variables: dict[str, Any]) -> None:
+    if "template" in variables:
+        return
+    template = match.group(1).strip()
+    variables["template"] = {"type": "template", "example": template}
+
+
+def _input_dir(match: re.Match[str], variables: dict[str, Any]) -> None:
+    if "input_dir" in variables:
+        return
+    input_dir = match.group(1).strip()
+    variables["input_dir"] = {"type": "path", "example": input_dir}
+
+
+def _output_dir(match: re.Match[str], variables: dict[str, Any]) -> None:
+    if "output_dir" in variables:
+        return
+    output_dir = match.group(1).strip()
+    variables["output_dir"] = {"type": "path", "example": output_dir}
+
+
+_HANDLERS: dict[str, VariableHandler] = {
+    "format_conversion": _format_conversion,
+    "batch_pattern": _batch_pattern,
+    "template": _template,
+    "input_dir": _input_dir,
+    "output_dir": _output_dir,
+}
+
+
 class DocumentExtractor(BasePatternExtractor):
     """Pattern extractor for document processing workflows."""
 
@@ -30,47 +87,5 @@ class DocumentExtractor(BasePatternExtractor):
         - Template references
         - Input/output directories
         """
-        # Extract format conversion patterns
-        if match := FORMAT_CONVERSION_RE.search(text):
-            source_format = match.group(1).strip()
-            target_format = match.group(2).strip()
-            variables.setdefault(
-                "source_format",
-                {"type": "format", "example": source_format},
-            )
-            variables.setdefault(
-                "target_format",
-                {"type": "format", "example": target_format},
-            )
-
-        # Extract batch processing patterns
-        if match := BATCH_PATTERN_RE.search(text):
-            item_type = match.group(1).strip()
-            variables.setdefault(
-                "batch_item",
-                {"type": "item", "example": item_type},
-            )
-
-        # Extract template references
-        if match := TEMPLATE_RE.search(text):
-            template = match.group(1).strip()
-            variables.setdefault(
-                "template",
-                {"type": "template", "example": template},
-            )
-
-        # Extract input directory
-        if match := INPUT_DIR_RE.search(text):
-            input_dir = match.group(1).strip()
-            variables.setdefault(
-                "input_dir",
-                {"type": "path", "example": input_dir},
-            )
-
-        # Extract output directory
-        if match := OUTPUT_DIR_RE.search(text):
-            output_dir = match.group(1).strip()
-            variables.setdefault(
-                "output_dir",
-                {"type": "path", "example": output_dir},
-            )
+        for kind, match in _SCANNER.first_matches(text).items():
+            _HANDLERS[kind](match, variables)
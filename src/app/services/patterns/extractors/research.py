@@ -5,7 +5,7 @@ from __future__ import annotations
 import re
 from typing import Any
 
-from .base import BasePatternExtractor
+from .base import BasePatternExtractor, PatternScanner, VariableHandler
 
 # Research-specific regex patterns
 CITATION_RE = re.compile(r'\[(\d+)\]|\(([^)]+,\s*\d{4})\)', re.IGNORECASE)
@@ -15,6 +15,60 @@ SOURCE_DOC_RE = re.compile(r'(?:source|document|paper|article):\s*([^\n,]+)', re
 TOPIC_RE = re.compile(r'(?:topic|subject|area):\s*([^\n,]+)', re.IGNORECASE)
 
 
+_SCANNER = PatternScanner(
+    {
+        "citation": CITATION_RE,
+        "url": URL_RE,
+        "query": QUERY_RE,
+        "source_doc": SOURCE_DOC_RE,
+        "topic": TOPIC_RE,
+    }
+)
+
+
+def _citation(match: re.Match[str], variables: dict[str, Any]) -> None:
+    if "citation" in variables:
+        return
+    citation = match.group(1) or match.group(2)
+    variables["citation"] = {"type": "citation", "example": citation}
+
+
+def _url(match: re.Match[str], variables: dict[str, Any]) -> None:
+    if "url" in variables:
+        return
+    variables["url"] = {"type": "url", "example": match.group(0)[:50]}
+
+
+def _query(match: re.Match[str], variables: dict[str, Any]) -> None:
+    if "search_query" in variables:
+        return
+    query = match.group(1).strip()
+    variables["search_query"] = {"type": "query", "example": query}
+
+
+def _source_doc(match: re.Match[str], variables: dict[str, Any]) -> None:
+    if "source_doc" in variables:
+        return
+    source = match.group(1).strip()
+    variables["source_doc"] = {"type": "document", "example": source}
+
+
+def _topic(match: re.Match[str], variables: dict[str, Any]) -> None:
+    if "research_topic" in variables:
+        return
+    topic = match.group(1).strip()
+    variables["research_topic"] = {"type": "topic", "example": topic}
+
+
+_HANDLERS: dict[str, VariableHandler] = {
+    "citation": _citation,
+    "url": _url,
+    "query": _query,
+    "source_doc": _source_doc,
+    "topic": _topic,
+}
+
+
 class ResearchExtractor(BasePatternExtractor):
     """Pattern extractor for research workflows."""
 
@@ -29,41 +83,5 @@ class ResearchExtractor(BasePatternExtractor):
         - Source documents
         - Research topics
         """
-        # Extract citations
-        if match := CITATION_RE.search(text):
-            citation = match.group(1) or match.group(2)
-            variables.setdefault(
-                "citation",
-                {"type": "citation", "example": citation},
-            )
-
-        # Extract URLs
-        if match := URL_RE.search(text):
-            variables.setdefault(
-                "url",
-                {"type": "url", "example": match.group(0)[:50]},
-            )
-
-        # Extract search queries
-        if match := QUERY_RE.search(text):
-            query = match.group(1).strip()
-            variables.setdefault(
-                "search_query",
-                {"type": "query", "example": query},
-            )
-
-        # Extract source documents
-        if match := SOURCE_DOC_RE.search(text):
-            source = match.group(1).strip()
-            variables.setdefault(
-                "source_doc",
-                {"type": "document", "example": source},
-            )
-
-        # Extract research topics
-        if match := TOPIC_RE.search(text):
-            topic = match.group(1).strip()
-            variables.setdefault(
-                "research_topic",
-                {"type": "topic", "example": topic},
-            )
+        for kind, match in _SCANNER.first_matches(text).items():
+            _HANDLERS[kind](match, variables)
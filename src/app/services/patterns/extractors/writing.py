@@ -5,7 +5,7 @@ from __future__ import annotations
 import re
 from typing import Any
 
-from .base import BasePatternExtractor
+from .base import BasePatternExtractor, PatternScanner, VariableHandler
 
 # Writing-specific regex patterns
 TONE_RE = re.compile(r'(?:tone|voice):\s*(\w+)', re.IGNORECASE)
@@ -16,6 +16,70 @@ STYLE_GUIDE_RE = re.compile(r'(?:style guide|style):\s*([^\n,]+)', re.IGNORECASE
 DOC_TYPE_RE = re.compile(r'(?:article|report|paper|essay|blog post|documentation)', re.IGNORECASE)
 
 
+_SCANNER = PatternScanner(
+    {
+        "tone": TONE_RE,
+        "audience": AUDIENCE_RE,
+        "structure": STRUCTURE_RE,
+        "word_count": WORD_COUNT_RE,
+        "style_guide": STYLE_GUIDE_RE,
+        "doc_type": DOC_TYPE_RE,
+    }
+)
+
+
+def _tone(match: re.Match[str], variables: dict[str, Any]) -> None:
+    if "tone" in variables:
+        return
+    tone = match.group(1).strip()
+    variables["tone"] = {"type": "style", "example": tone}
+
+
+def _audience(match: re.Match[str], variables: dict[str, Any]) -> None:
+    if "audience" in variables:
+        return
+    audience = match.group(1).strip()
+    variables["audience"] = {"type": "audience", "example": audience}
+
+
+def _structure(match: re.Match[str], variables: dict[str, Any]) -> None:
+    if "structure" in variables:
+        return
+    structure = match.group(1).strip()
+    variables["structure"] = {"type": "structure", "example": structure}
+
+
+def _word_count(match: re.Match[str], variables: dict[str, Any]) -> None:
+    if "word_count" in variables:
+        return
+    count = match.group(1)
+    variables["word_count"] = {"type": "length", "example": f"{count} words"}
+
+
+def _style_guide(match: re.Match[str], variables: dict[str, Any]) -> None:
+    if "style_guide" in variables:
+        return
+    style = match.group(1).strip()
+    variables["style_guide"] = {"type": "style_guide", "example": style}
+
+
+def _doc_type(match: re.Match[str], variables: dict[str, Any]) -> None:
+    if "document_type" in variables:
+        return
+    doc_type = match.group(0).lower()
+    variables["document_type"] = {"type": "format", "example": doc_type}
+
+
+_HANDLERS: dict[str, VariableHandler] = {
+    "tone": _tone,
+    "audience": _audience,
+    "structure": _structure,
+    "word_count": _word_count,
+    "style_guide": _style_guide,
+    "doc_type": _doc_type,
+}
+
+
 class WritingExtractor(BasePatternExtractor):
     """Pattern extractor for writing workflows."""
 
@@ -31,50 +95,5 @@ class WritingExtractor(BasePatternExtractor):
         - Style guides
         - Document type
         """
-        # Extract tone
-        if match := TONE_RE.search(text):
-            tone = match.group(1).strip()
-            variables.setdefault(
-                "tone",
-                {"type": "style", "example": tone},
-            )
-
-        # Extract audience
-        if match := AUDIENCE_RE.search(text):
-            audience = match.group(1).strip()
-            variables.setdefault(
-                "audience",
-                {"type": "audience", "example": audience},
-            )
-
-        # Extract structure
-        if match := STRUCTURE_RE.search(text):
-            structure = match.group(1).strip()
-            variables.setdefault(
-                "structure",
-                {"type": "structure", "example": structure},
-            )
-
-        # Extract word count
-        if match := WORD_COUNT_RE.search(text):
-            count = match.group(1)
-            variables.setdefault(
-                "word_count",
-                {"type": "length", "example": f"{count} words"},
-            )
-
-        # Extract style guide
-        if match := STYLE_GUIDE_RE.search(text):
-            style = match.group(1).strip()
-            variables.setdefault(
-                "style_guide",
-                {"type": "style_guide", "example": style},
-            )
-
-        # Extract document type
-        if match := DOC_TYPE_RE.search(text):
-            doc_type = match.group(0).lower()
-            variables.setdefault(
-                "document_type",
-                {"type": "format", "example": doc_type},
-            )
+        for kind, match in _SCANNER.first_matches(text).items():
+            _HANDLERS[kind](match, variables)
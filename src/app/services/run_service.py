@@ -1,31 +1,52 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import ctypes
+import ctypes.util
+import errno
+import heapq
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+import os
+import re
 import shutil
-import subprocess
+import sys
+import threading
+import time
 from urllib.parse import quote
 
+try:
+    import fcntl  # type: ignore
+except ImportError:
+    fcntl = None
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .. import repositories
 from ..database import AsyncSessionLocal
 from ..config import settings
-from ..models import Artifact, Run, Step
+from ..errors import parse_error_notes
+from ..models import Artifact, Run
 from ..services import patterns as pattern_service
 from ..services import runner_client
 from ..services import diff as diff_service
 from ..services import pattern_agent
 from ..services import machine_summary as machine_summary_service
-from ..utils import new_id
-from ..events import run_events
+from ..utils import json_dumps, new_id, new_ids
+from ..events import run_events, run_progress
 
 logger = logging.getLogger(__name__)
 
+FINAL_STATUSES = frozenset({"succeeded", "failed", "cancelled"})
+_PERSISTED_ROLES = frozenset({"user", "assistant"})
+# Tool reports with more files + notes than this are JSON-encoded off the event loop
+_INLINE_ENCODE_MAX_ITEMS = 2048
+
 
 @dataclass
 class RunRequest:
@@ -81,49 +102,234 @@ def _compose_system_instructions(pattern_block: str, run_prompt: str) -> str:
     blocks = []
     if pattern_block:
         blocks.append(pattern_block.strip())
-    blocks.append(settings.base_prompt.strip())
+    blocks.append(_stripped_base_prompt(settings.base_prompt))
     blocks.append(run_prompt.strip())
     return "\n\n".join(blocks).strip()
 
 
+# Settings are effectively fixed after load, but keying on the raw value keeps these
+# correct if they are reassigned (as the tests do with workspace_root).
+@lru_cache(maxsize=4)
+def _stripped_base_prompt(base_prompt: str) -> str:
+    return base_prompt.strip()
+
+
+@lru_cache(maxsize=4)
+def _resolved_workspace_root(workspace_root: Path) -> Path:
+    return workspace_root.resolve()
+
+
 def _now_iso() -> str:
-    return datetime.utcnow().isoformat(timespec="seconds") + "Z"
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+# Characters quote() leaves untouched; generated ids always match, so skip quoting them
+_SAFE_SEGMENT_RE = re.compile(r"[A-Za-z0-9_.~\-]+")
 
 
+# Project ids repeat across runs, so keep recent encodings around
+@lru_cache(maxsize=4096)
 def _safe_path_segment(raw: str, fallback: str) -> str:
     trimmed = raw.strip()
     if not trimmed:
         trimmed = fallback
-    encoded = quote(trimmed, safe="")
-    return encoded or fallback
+    if _SAFE_SEGMENT_RE.fullmatch(trimmed):
+        encoded = trimmed
+    else:
+        encoded = quote(trimmed, safe="")
+    # Encoding leaves no separators, so "." and ".." are the only names left that
+    # could step outside the tree; encode dot-only segments as well.
+    if not encoded.strip("."):
+        return encoded.replace(".", "%2E")
+    return encoded
 
 
 def _workspace_path(project_id: str, run_id: str) -> Path:
-    root = settings.workspace_root.resolve()
+    return _workspace_path_under(settings.workspace_root, project_id, run_id)
+
+
+# The file API resolves the same run's workspace on every request
+@lru_cache(maxsize=1024)
+def _workspace_path_under(workspace_root: Path, project_id: str, run_id: str) -> Path:
+    root = str(_resolved_workspace_root(workspace_root))
     project_segment = _safe_path_segment(project_id, "project")
     run_segment = _safe_path_segment(run_id, "run")
-    candidate = (root / project_segment / run_segment).resolve()
-    if not candidate.is_relative_to(root):
-        raise ValueError("Workspace path escaped workspace root")
-    return candidate
+    # Both segments are plain names, so the path stays under root by construction
+    return Path(root, project_segment, run_segment)
 
 
-def _ensure_git_repo(workspace: Path) -> None:
-    git_dir = workspace / ".git"
-    if git_dir.exists():
+async def _ensure_git_repo(workspace: Path) -> None:
+    if os.path.exists(os.path.join(workspace, ".git")):
         return
     try:
-        subprocess.run(
-            ["git", "init", "-q"],
+        # Output is never read, so don't allocate pipes for it
+        process = await asyncio.create_subprocess_exec(
+            "git",
+            "init",
+            "-q",
             cwd=str(workspace),
-            check=True,
-            capture_output=True,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
         )
-    except (subprocess.CalledProcessError, FileNotFoundError):
+        await process.wait()
+    except FileNotFoundError:
         # Git not available; proceed without initialization (Codex will skip repo check)
         pass
 
 
+# ioctl request number for FICLONE (reflink a whole file) on Linux
+_FICLONE = 0x40049409
+
+# Reflink/copy_file_range errors that mean "not possible here" rather than a real I/O failure
+_COPY_RANGE_FALLBACK_ERRNOS = frozenset(
+    {
+        errno.EXDEV,
+        errno.ENOSYS,
+        errno.EINVAL,
+        errno.EOPNOTSUPP,
+        errno.EBADF,
+        errno.ETXTBSY,
+        errno.ENOTTY,
+    }
+)
+
+
+def _reflink(src_fd: int, dst_fd: int) -> bool:
+    if fcntl is None:
+        return False
+    try:
+        fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+    except OSError as exc:
+        if exc.errno not in _COPY_RANGE_FALLBACK_ERRNOS:
+            raise
+        return False
+    return True
+
+
+def _load_clonefile() -> Any:
+    """Return libc's clonefile(2) on macOS (APFS copy-on-write clones), else None."""
+    if sys.platform != "darwin":
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        clonefile = libc.clonefile
+    except (OSError, AttributeError):
+        return None
+    clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32]
+    clonefile.restype = ctypes.c_int
+    return clonefile
+
+
+_clonefile = _load_clonefile()
+
+
+def _fast_copy(source: str | Path, destination: str | Path) -> None:
+    """
+    Copy a file with its metadata, keeping the bytes inside the kernel.
+
+    On macOS tries ``clonefile`` (APFS). Elsewhere tries a FICLONE reflink (O(1) on
+    btrfs/XFS), then ``os.copy_file_range`` (Linux), and falls back to
+    ``shutil.copyfile``, which already uses ``sendfile`` where available.
+    """
+    # clonefile copies metadata too; it fails (e.g. EEXIST, EXDEV) rather than
+    # half-copying, so any error just means "copy normally"
+    if _clonefile is not None and _clonefile(os.fsencode(source), os.fsencode(destination), 0) == 0:
+        return
+
+    copy_file_range = getattr(os, "copy_file_range", None)
+    size = os.stat(source).st_size
+    if copy_file_range is None or size == 0:
+        shutil.copy2(source, destination)
+        return
+
+    copied = 0
+    try:
+        with open(source, "rb") as src, open(destination, "wb") as dst:
+            if _reflink(src.fileno(), dst.fileno()):
+                copied = size
+            while copied < size:
+                sent = copy_file_range(src.fileno(), dst.fileno(), size - copied)
+                if sent == 0:
+                    break
+                copied += sent
+    except OSError as exc:
+        if exc.errno not in _COPY_RANGE_FALLBACK_ERRNOS:
+            raise
+        copied = 0
+    if copied == 0:
+        shutil.copyfile(source, destination)
+    shutil.copystat(source, destination)
+
+
+# Hardlink errors that mean "use a real copy instead"
+_LINK_FALLBACK_ERRNOS = frozenset({errno.EXDEV, errno.EMLINK, errno.EPERM, errno.EEXIST})
+
+
+def _link_or_copy(source: str | Path, destination: str | Path) -> None:
+    """
+    Hardlink a file into place, copying it when a link is not possible.
+
+    The clone then shares inodes with the source run, so anything that writes into
+    a cloned file in place also changes the source; hence this is opt-in.
+    """
+    try:
+        os.link(source, destination)
+    except OSError as exc:
+        if exc.errno not in _LINK_FALLBACK_ERRNOS:
+            raise
+        _fast_copy(source, destination)
+
+
+class _MultithreadedCopier(ThreadPoolExecutor):
+    """Thread pool that copies files in the background; re-raises the first copy error on exit."""
+
+    def __init__(self, max_workers: int, max_pending: int = 256, hardlink: bool = False) -> None:
+        super().__init__(max_workers=max_workers)
+        self._copy_function = _link_or_copy if hardlink else _fast_copy
+        # Bound queued copies so huge trees don't pile up futures faster than they drain
+        self._pending = threading.BoundedSemaphore(max_pending)
+        self._errors: list[BaseException] = []
+
+    def copy(self, source: str | Path, destination: str | Path) -> None:
+        self._pending.acquire()
+        self.submit(self._copy_function, source, destination).add_done_callback(self._copy_done)
+
+    def _copy_done(self, future: Future[Any]) -> None:
+        self._pending.release()
+        error = future.exception()
+        if error is not None:
+            self._errors.append(error)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        result = super().__exit__(exc_type, exc_val, exc_tb)
+        if exc_type is None and self._errors:
+            raise self._errors[0]
+        return result
+
+
+def _copy_tree(
+    source: str,
+    destination: str,
+    copier: _MultithreadedCopier,
+    directories: list[tuple[str, str]],
+) -> None:
+    """
+    Copy a directory tree like ``shutil.copytree(symlinks=False)``, one scandir per directory.
+
+    File copies are queued on ``copier``. Directory pairs are appended to ``directories``
+    children first, so their metadata can be copied once the queued writes have landed.
+    """
+    os.makedirs(destination, exist_ok=True)
+    with os.scandir(source) as entries:
+        for entry in entries:
+            target = os.path.join(destination, entry.name)
+            if entry.is_dir():
+                _copy_tree(entry.path, target, copier, directories)
+            else:
+                copier.copy(entry.path, target)
+    directories.append((source, destination))
+
+
 def _clone_workspace_contents(source: Path, destination: Path) -> list[str]:
     copied: list[str] = []
     try:
@@ -131,29 +337,37 @@ def _clone_workspace_contents(source: Path, destination: Path) -> list[str]:
             return copied
     except FileNotFoundError:
         return copied
-    for entry in source.iterdir():
-        target = destination / entry.name
-        if entry.is_symlink():
-            if target.exists() or target.is_symlink():
-                if target.is_dir():
-                    shutil.rmtree(target)
-                else:
-                    target.unlink()
-            target.symlink_to(entry.readlink())
-            copied.append(entry.name)
-            continue
-        if entry.is_dir():
-            shutil.copytree(entry, target, dirs_exist_ok=True)
-            copied.append(f"{entry.name}/")
-            continue
-        if entry.is_file():
-            target.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(entry, target, follow_symlinks=False)
-            copied.append(entry.name)
+    destination.mkdir(parents=True, exist_ok=True)
+    copier = _MultithreadedCopier(
+        max_workers=max(1, settings.clone_workers), hardlink=settings.clone_hardlinks
+    )
+    directories: list[tuple[str, str]] = []
+    with copier, os.scandir(source) as entries:
+        for entry in entries:
+            target = destination / entry.name
+            if entry.is_symlink():
+                if target.exists() or target.is_symlink():
+                    if target.is_dir():
+                        shutil.rmtree(target)
+                    else:
+                        target.unlink()
+                target.symlink_to(os.readlink(entry.path))
+                copied.append(entry.name)
+                continue
+            if entry.is_dir():
+                _copy_tree(entry.path, str(target), copier, directories)
+                copied.append(f"{entry.name}/")
+                continue
+            if entry.is_file():
+                copier.copy(entry.path, target)
+                copied.append(entry.name)
+    # File writes bump directory mtimes, so copy directory stats after the copier drains
+    for source_dir, destination_dir in directories:
+        shutil.copystat(source_dir, destination_dir)
     return copied
 
 
-def _prepare_workspace(
+def _clone_into_workspace(
     project_id: str,
     run_id: str,
     from_run_id: str | None,
@@ -167,29 +381,75 @@ def _prepare_workspace(
         if source_workspace.exists():
             source_found = True
             cloned_entries = _clone_workspace_contents(source_workspace, workspace)
-    _ensure_git_repo(workspace)
     return workspace, cloned_entries, source_found
 
 
+async def _prepare_workspace(
+    project_id: str,
+    run_id: str,
+    from_run_id: str | None,
+) -> tuple[Path, list[str], bool]:
+    # File copying blocks, so it runs in a worker thread; git init is awaited as a subprocess
+    workspace, cloned_entries, source_found = await asyncio.to_thread(
+        _clone_into_workspace, project_id, run_id, from_run_id
+    )
+    # A cloned .git directory means the workspace is already a repository
+    if ".git/" not in cloned_entries:
+        await _ensure_git_repo(workspace)
+    return workspace, cloned_entries, source_found
+
+
+def _walk_workspace_files(root: str) -> Iterator[os.DirEntry[str]]:
+    """Yield file entries under root, pruning .git directories without descending."""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name != ".git":
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError:
+            continue
+
+
 def _collect_workspace_files(workspace: Path) -> list[dict[str, Any]]:
     """Collect a summary of files in the workspace."""
-    files = []
     if not workspace.exists():
-        return files
+        return []
 
-    for path in workspace.rglob("*"):
-        if path.is_file():
-            rel_path = path.relative_to(workspace)
-            # Skip .git internals
-            if str(rel_path).startswith(".git/"):
-                continue
+    root = str(workspace)
+    files = [
+        {"path": os.path.relpath(entry.path, root), "size": entry.stat().st_size}
+        for entry in _walk_workspace_files(root)
+    ]
+    files.sort(key=itemgetter("path"))
+    return files
 
-            files.append({
-                "path": str(rel_path),
-                "size": path.stat().st_size,
-            })
 
-    return sorted(files, key=lambda f: f["path"])
+def _summarize_workspace_files(
+    workspace: Path, limit: int = 20
+) -> tuple[list[dict[str, Any]], int]:
+    """Return the first ``limit`` files by path and the total file count."""
+    if not workspace.exists():
+        return [], 0
+
+    root = str(workspace)
+    total = 0
+
+    def counted() -> Iterator[tuple[str, os.DirEntry[str]]]:
+        nonlocal total
+        for entry in _walk_workspace_files(root):
+            total += 1
+            yield os.path.relpath(entry.path, root), entry
+
+    # Only the files that make the cut are stat'ed
+    first = heapq.nsmallest(limit, counted(), key=itemgetter(0))
+    files = [{"path": path, "size": entry.stat().st_size} for path, entry in first]
+    return files, total
 
 
 async def launch_run(
@@ -199,12 +459,10 @@ async def launch_run(
     pattern_block: str,
     from_run_id: str | None = None,
 ) -> dict[str, Any]:
-    import time
-
     start_time = time.time()
 
     # Progress: Workspace preparation (0-20%)
-    await _update_progress(session, run.id, 0)
+    _update_progress(run.id, 0)
     await run_events.publish(
         run.id,
         {
@@ -216,7 +474,7 @@ async def launch_run(
     )
 
     source_run_id = from_run_id or run.workspace_from_run_id
-    workspace, cloned_entries, source_found = _prepare_workspace(
+    workspace, cloned_entries, source_found = await _prepare_workspace(
         run.project_id, run.id, source_run_id
     )
 
@@ -226,25 +484,26 @@ async def launch_run(
             "run_id": run.id,
             "source_run_id": source_run_id,
         }
+        pending: list[dict[str, Any]] = []
         if source_found:
             event["action"] = "cloned"
             event["entries"] = cloned_entries
-            await _update_progress(session, run.id, 20)
-            await run_events.publish(
-                run.id,
+            _update_progress(run.id, 20)
+            pending.append(
                 {
                     "type": "progress",
                     "stage": "workspace_cloned",
                     "message": f"Cloned {len(cloned_entries)} items from previous run",
                     "percent": 20,
                     "details": {"files": cloned_entries[:10]},
-                },
+                }
             )
         else:
             event["action"] = "clone-missing"
-        await run_events.publish(run.id, event)
+        pending.append(event)
+        await run_events.publish_many(run.id, pending)
     else:
-        await _update_progress(session, run.id, 20)
+        _update_progress(run.id, 20)
         await run_events.publish(
             run.id,
             {
@@ -267,7 +526,7 @@ async def launch_run(
             resume_thread_id = reference_run.codex_thread_id
 
     # Progress: Executing (30%)
-    await _update_progress(session, run.id, 30)
+    _update_progress(run.id, 30)
     await run_events.publish(
         run.id,
         {
@@ -290,7 +549,7 @@ async def launch_run(
         )
 
         # Progress: Processing results (70%)
-        await _update_progress(session, run.id, 70)
+        _update_progress(run.id, 70)
         await run_events.publish(
             run.id,
             {
@@ -301,17 +560,26 @@ async def launch_run(
             },
         )
 
-        await _persist_messages(session, run.id, runner_response.get("messages", []))
+        # Message and tool report events go out together once both are recorded
+        events = await _persist_messages(session, run.id, runner_response.get("messages", []))
         context_variables = runner_response.get("context_variables", {})
-        await _persist_tool_reports(session, run.id, context_variables)
+        events += await _persist_tool_reports(session, run.id, context_variables)
+        await run_events.publish_many(run.id, events)
         new_thread_id = context_variables.get("codex_thread_id")
         if new_thread_id:
+            # Written with the next flush or status commit
             run.codex_thread_id = new_thread_id
-            await session.flush()
-        await _persist_diff_summary(session, run.id, workspace)
+
+        # The git diff and the workspace file walk only touch the filesystem, so run
+        # them side by side off the event loop; DB writes stay on this session.
+        diff_result, (workspace_files, total_files) = await asyncio.gather(
+            asyncio.to_thread(_write_diff_summary, run.id, workspace),
+            asyncio.to_thread(_summarize_workspace_files, workspace),
+        )
+        await _persist_diff_summary(session, run.id, diff_result)
 
         # Progress: Pattern extraction (85%)
-        await _update_progress(session, run.id, 85)
+        _update_progress(run.id, 85)
         await run_events.publish(
             run.id,
             {
@@ -328,8 +596,6 @@ async def launch_run(
             logger.exception("Pattern agent failed for run %s", run.id)
     except Exception as exc:
         # Publish error event with helpful message
-        from ..errors import parse_error_notes
-
         error_info = None
         if hasattr(exc, "args") and exc.args:
             error_info = parse_error_notes(exc.args)
@@ -354,40 +620,38 @@ async def launch_run(
                 },
             )
 
-        await _record_error(session, run.id, error_record)
+        # Roll back the partial run first so the error record is committed with the status
+        run_id = run.id
         await session.rollback()
-        await _update_status(session, run.id, "failed")
+        await _record_error(session, run_id, error_record)
+        await _update_status(session, run_id, "failed")
         raise
 
     # Progress: Complete (100%)
     elapsed = time.time() - start_time
 
-    # Collect workspace file summary
-    workspace_files = _collect_workspace_files(workspace)
-
-    await _update_progress(session, run.id, 100)
-    await run_events.publish(
-        run.id,
+    _update_progress(run.id, 100)
+    completion_events: list[dict[str, Any]] = [
         {
             "type": "progress",
             "stage": "complete",
             "message": f"Run completed in {elapsed:.1f}s",
             "percent": 100,
             "elapsed": elapsed,
-        },
-    )
+        }
+    ]
 
     # Publish workspace summary
     if workspace_files:
-        await run_events.publish(
-            run.id,
+        completion_events.append(
             {
                 "type": "workspace_summary",
                 "run_id": run.id,
-                "files": workspace_files[:20],  # First 20 files
-                "total_files": len(workspace_files),
-            },
+                "files": workspace_files,
+                "total_files": total_files,
+            }
         )
+    await run_events.publish_many(run.id, completion_events)
 
     # Generate machine summary for DraftPunk
     await _generate_and_store_summary(session, run.id, workspace)
@@ -400,106 +664,159 @@ async def _persist_messages(
     session: AsyncSession,
     run_id: str,
     messages: list[dict[str, Any]],
-) -> None:
-    for msg in messages:
-        role = msg.get("role")
-        if role not in {"user", "assistant"}:
-            continue
-        content = _serialize_message_content(msg)
-        step = Step(
-            id=new_id("step"),
-            run_id=run_id,
-            t=_now_iso(),
-            role=role,
-            content=content,
-        )
-        await repositories.steps.record_step(session, step)
-        await run_events.publish(
-            run_id,
-            {
-                "type": "step",
-                "step_id": step.id,
-                "role": role,
-                "content": content,
-                "t": step.t,
-            },
+) -> list[dict[str, Any]]:
+    """Record a step per user/assistant message and return the step events to publish."""
+    persisted = [msg for msg in messages if msg.get("role") in _PERSISTED_ROLES]
+    if not persisted:
+        return []
+
+    # Steps persisted together share a second-resolution timestamp
+    now = _now_iso()
+    rows = [
+        {
+            "id": step_id,
+            "run_id": run_id,
+            "t": now,
+            "role": msg["role"],
+            "content": _serialize_message_content(msg),
+        }
+        for step_id, msg in zip(new_ids("step", len(persisted)), persisted)
+    ]
+
+    await repositories.steps.record_steps(session, rows)
+    return [
+        {
+            "type": "step",
+            "step_id": row["id"],
+            "role": row["role"],
+            "content": row["content"],
+            "t": now,
+        }
+        for row in rows
+    ]
+
+
+def _encode_tool_report_fields(reports: list[dict[str, Any]]) -> list[tuple[str, str, str]]:
+    """Return the (files, notes, tool args) JSON columns for each tool report."""
+    return [
+        (
+            json_dumps(report.get("files", [])),
+            json_dumps(report.get("notes", [])),
+            json_dumps({"prompt": report.get("prompt")}),
         )
+        for report in reports
+    ]
 
 
 async def _persist_tool_reports(
     session: AsyncSession,
     run_id: str,
     context_variables: dict[str, Any],
-) -> None:
+) -> list[dict[str, Any]]:
+    """Record tool report steps and log artifacts and return their events to publish."""
     reports = context_variables.get("tool_reports") or []
-    for report in reports:
+    if not reports:
+        return []
+
+    # Encoding thousands of file paths would stall the event loop, so big batches
+    # are serialized in a worker thread
+    item_count = sum(len(r.get("files") or ()) + len(r.get("notes") or ()) for r in reports)
+    if item_count > _INLINE_ENCODE_MAX_ITEMS:
+        encoded = await asyncio.to_thread(_encode_tool_report_fields, reports)
+    else:
+        encoded = _encode_tool_report_fields(reports)
+
+    step_rows: list[dict[str, Any]] = []
+    artifact_rows: list[dict[str, Any]] = []
+    events: list[dict[str, Any]] = []
+    now = _now_iso()
+    step_ids = new_ids("step", len(reports))
+    for step_id, report, (files_json, notes_json, args_json) in zip(step_ids, reports, encoded):
         files = report.get("files", [])
         notes = report.get("notes", [])
-        step = Step(
-            id=new_id("step"),
-            run_id=run_id,
-            t=_now_iso(),
-            role="tool",
-            content=f"{report.get('tool','tool')} result",
-            outcome_ok=report.get("ok"),
-            files_json=json.dumps(files),
-            outcome_notes_json=json.dumps(notes),
-            tool_name=report.get("tool"),
-            tool_args_json=json.dumps({"prompt": report.get("prompt")}),
+        content = f"{report.get('tool','tool')} result"
+        step_rows.append(
+            {
+                "id": step_id,
+                "run_id": run_id,
+                "t": now,
+                "role": "tool",
+                "content": content,
+                "outcome_ok": report.get("ok"),
+                "files_json": files_json,
+                "outcome_notes_json": notes_json,
+                "tool_name": report.get("tool"),
+                "tool_args_json": args_json,
+            }
         )
-        await repositories.steps.record_step(session, step)
-        await run_events.publish(
-            run_id,
+        events.append(
             {
                 "type": "step",
-                "step_id": step.id,
+                "step_id": step_id,
                 "role": "tool",
-                "content": step.content,
-                "t": step.t,
+                "content": content,
+                "t": now,
                 "files": files,
                 "notes": notes,
                 "ok": report.get("ok"),
-            },
+            }
         )
 
         artifact_path = report.get("artifact_path")
         if artifact_path:
+            artifact_id = new_id("artifact")
             byte_count = int(report.get("bytes") or 0)
             # Codex execution logs are always JSONL format
             # Future: could also register output files created during execution
-            artifact = Artifact(
-                id=new_id("artifact"),
-                run_id=run_id,
-                kind="codex-jsonl",  # Execution log from Codex CLI
-                path=artifact_path,
-                bytes=byte_count,
+            artifact_rows.append(
+                {
+                    "id": artifact_id,
+                    "run_id": run_id,
+                    "kind": "codex-jsonl",  # Execution log from Codex CLI
+                    "path": artifact_path,
+                    "bytes": byte_count,
+                }
             )
-            await repositories.artifacts.add_artifact(session, artifact)
-            await run_events.publish(
-                run_id,
+            events.append(
                 {
                     "type": "artifact",
-                    "artifact_id": artifact.id,
-                    "path": artifact.path,
-                    "bytes": artifact.bytes,
-                },
+                    "artifact_id": artifact_id,
+                    "path": artifact_path,
+                    "bytes": byte_count,
+                }
             )
 
+    await repositories.steps.record_steps(session, step_rows)
+    await repositories.artifacts.add_artifacts(session, artifact_rows)
+    return events
+
 
-async def _persist_diff_summary(session: AsyncSession, run_id: str, workspace: Path) -> None:
+def _write_diff_summary(run_id: str, workspace: Path) -> tuple[dict[str, Any], Path, int] | None:
+    """Collect the git diff summary and write its artifact file (blocking)."""
     diff_summary = diff_service.collect_git_diff_summary(workspace)
     if not diff_summary:
-        return
+        return None
 
     artifact_path = settings.artifacts_root / f"{run_id}-diff.json"
-    diff_service.write_diff_artifact(artifact_path, diff_summary)
+    byte_count = diff_service.write_diff_artifact(artifact_path, diff_summary)
+    return diff_summary, artifact_path, byte_count
+
+
+async def _persist_diff_summary(
+    session: AsyncSession,
+    run_id: str,
+    diff_result: tuple[dict[str, Any], Path, int] | None,
+) -> None:
+    if diff_result is None:
+        return
 
+    diff_summary, artifact_path, byte_count = diff_result
     artifact = Artifact(
         id=new_id("artifact"),
         run_id=run_id,
         kind="diff-summary",
         path=str(artifact_path),
-        bytes=artifact_path.stat().st_size,
+        bytes=byte_count,
     )
     await repositories.artifacts.add_artifact(session, artifact)
     await run_events.publish(
@@ -514,6 +831,13 @@ async def _persist_diff_summary(session: AsyncSession, run_id: str, workspace: P
 
 
 async def _update_status(session: AsyncSession, run_id: str, status: str) -> None:
+    # Intermediate progress only goes out over the event stream and the in-memory store;
+    # it is written to the runs table together with the next status change.
+    progress = run_progress.get(run_id)
+    if progress is not None:
+        await repositories.runs.update_run_progress(session, run_id, progress)
+    if status in FINAL_STATUSES:
+        run_progress.pop(run_id)
     await repositories.runs.update_run_status(session, run_id, status)
     await session.commit()
     await run_events.publish(
@@ -526,36 +850,14 @@ async def _update_status(session: AsyncSession, run_id: str, status: str) -> Non
     )
 
 
-async def _update_progress(session: AsyncSession, run_id: str, progress: int) -> None:
-    """Update run progress percentage."""
-    await repositories.runs.update_run_progress(session, run_id, progress)
-    await session.flush()
+def _update_progress(run_id: str, progress: int) -> None:
+    """Update run progress percentage; it is persisted with the next status change."""
+    run_progress.set(run_id, progress)
 
 
 async def _record_error(session: AsyncSession, run_id: str, error_record: dict[str, Any]) -> None:
     """Record a structured error for the run."""
-    # Load existing errors
-    run = await repositories.runs.get_run(session, run_id)
-    if not run:
-        return
-
-    errors = []
-    if run.errors_json:
-        try:
-            errors = json.loads(run.errors_json)
-        except json.JSONDecodeError:
-            pass
-
-    # Append new error
-    errors.append(error_record)
-
-    # Update run
-    await repositories.runs.update_run_errors(
-        session,
-        run_id,
-        had_errors=True,
-        errors_json=json.dumps(errors),
-    )
+    await repositories.runs.append_run_error(session, run_id, error_record)
     await session.flush()
 
 
@@ -571,11 +873,8 @@ async def _generate_and_store_summary(
         return
 
     # Fetch steps and artifacts
-    from ..repositories import steps as steps_repo
-    from ..repositories import artifacts as artifacts_repo
-
-    run_steps = await steps_repo.list_steps(session, run_id)
-    run_artifacts = await artifacts_repo.list_artifacts(session, run_id)
+    run_steps = await repositories.steps.list_steps_for_run(session, run_id)
+    run_artifacts = await repositories.artifacts.list_artifacts_for_run(session, run_id)
 
     # Generate summary
     summary = machine_summary_service.generate_machine_summary(
@@ -586,7 +885,7 @@ async def _generate_and_store_summary(
     )
 
     # Store as JSON
-    summary_json = json.dumps(summary)
+    summary_json = json_dumps(summary)
     await repositories.runs.update_run_summary(session, run_id, summary_json)
     await session.flush()
 
@@ -598,17 +897,21 @@ def _serialize_message_content(msg: dict[str, Any]) -> str:
     contain tool/function calls, so we persist those as JSON.
     """
     content = msg.get("content")
-    if isinstance(content, str):
+    # Messages come from decoded JSON, so exact type checks cover every case
+    content_type = type(content)
+    if content_type is str:
         return content
-    if isinstance(content, (list, dict)):
-        return json.dumps(content)
+    if content_type is list or content_type is dict:
+        return json_dumps(content)
     if content is not None:
         return str(content)
 
-    for key in ("tool_calls", "function_call"):
-        data = msg.get(key)
-        if data:
-            return json.dumps({key: data})
+    tool_calls = msg.get("tool_calls")
+    if tool_calls:
+        return json_dumps({"tool_calls": tool_calls})
+    function_call = msg.get("function_call")
+    if function_call:
+        return json_dumps({"function_call": function_call})
     return ""
 
 
@@ -633,3 +936,5 @@ async def launch_run_background(
         except Exception:
             # launch_run already emits failure status; nothing else to add here.
             return
+        finally:
+            run_progress.pop(run_id)
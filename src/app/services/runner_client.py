@@ -6,6 +6,25 @@ from typing import Any, Dict
 import httpx
 
 from ..config import settings
+from ..utils import json_dumps, json_loads
+
+# One client for the lifetime of the process so runs reuse keep-alive connections
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(timeout=None)
+    return _client
+
+
+async def aclose() -> None:
+    """Close the shared runner client (called on API shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
 
 
 async def invoke_run(
@@ -33,7 +52,10 @@ async def invoke_run(
     if resume_thread_id:
         payload["context_variables"]["codex_resume_thread_id"] = resume_thread_id
 
-    async with httpx.AsyncClient(timeout=None) as client:
-        resp = await client.post(f"{settings.runner_url}/run", json=payload)
-        resp.raise_for_status()
-        return resp.json()
+    resp = await _get_client().post(
+        f"{settings.runner_url}/run",
+        content=json_dumps(payload),
+        headers={"Content-Type": "application/json"},
+    )
+    resp.raise_for_status()
+    return json_loads(resp.content)
@@ -1,10 +1,18 @@
+import json
+import os
 import uuid
+from typing import Any
 
 try:
     from python_ulid import ULID  # type: ignore
 except ImportError:
     ULID = None
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
 
 def new_id(prefix: str) -> str:
     if ULID:
@@ -12,3 +20,25 @@ def new_id(prefix: str) -> str:
     else:
         suffix = uuid.uuid4().hex
     return f"{prefix}-{suffix}"
+
+
+def new_ids(prefix: str, count: int) -> list[str]:
+    """Generate ``count`` ids at once, reading the random bytes in a single call."""
+    if ULID:
+        return [new_id(prefix) for _ in range(count)]
+    suffixes = os.urandom(16 * count).hex()
+    return [f"{prefix}-{suffixes[i : i + 32]}" for i in range(0, 32 * count, 32)]
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize to a JSON string, using orjson when it is installed."""
+    if orjson:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse a JSON document, using orjson when it is installed."""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -7,8 +7,11 @@ Wraps HTTP API to provide clean Python interface.
 
 from __future__ import annotations
 
+import time
+
 import httpx
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any, Literal
 
 
@@ -25,6 +28,8 @@ TaskType = Literal[
 
 RunStatus = Literal["queued", "running", "succeeded", "failed", "cancelled"]
 
+FINAL_STATUSES = frozenset({"succeeded", "failed", "cancelled"})
+
 
 @dataclass
 class RunError:
@@ -108,10 +113,8 @@ class CodexSwarmClient:
         )
         print(f"Started run: {run.run_id}")
 
-        # Poll for completion
-        while run.status in ("queued", "running"):
-            run = client.get_run(run.run_id)
-            print(f"Progress: {run.progress}%")
+        # Wait for completion (streams status events, no polling)
+        run = client.wait_for_completion(run.run_id)
 
         if run.had_errors:
             for error in run.errors:
@@ -217,6 +220,48 @@ class CodexSwarmClient:
         response.raise_for_status()
         return self._parse_run_response(response.json())
 
+    def wait_for_completion(self, run_id: str, poll_interval: float = 2.0) -> RunSummary:
+        """
+        Block until a run reaches a final status.
+
+        Long-polls the server's wait endpoint, which answers as soon as the run
+        finishes. Falls back to polling get_run() if that endpoint is unavailable.
+
+        Args:
+            run_id: Run identifier
+            poll_interval: Seconds between polls when falling back to polling
+
+        Returns:
+            Complete run information for the finished run
+
+        Raises:
+            httpx.HTTPStatusError: On API errors (404 if not found)
+        """
+        # The server holds each request for up to wait_seconds, so allow a little more
+        wait_seconds = 30.0
+        timeout = httpx.Timeout(self.client.timeout.connect, read=wait_seconds + 10)
+        try:
+            while True:
+                response = self.client.get(
+                    f"/runs/{run_id}/wait",
+                    params={"timeout": wait_seconds},
+                    timeout=timeout,
+                )
+                if response.status_code != 200:
+                    # Older servers have no wait endpoint; get_run() raises for real errors
+                    break
+                run = self._parse_run_response(response.json())
+                if run.status in FINAL_STATUSES:
+                    return run
+        except (httpx.TransportError, ValueError):
+            pass
+
+        run = self.get_run(run_id)
+        while run.status not in FINAL_STATUSES:
+            time.sleep(poll_interval)
+            run = self.get_run(run_id)
+        return run
+
     def list_files(self, run_id: str) -> WorkspaceFileListing:
         """
         List files in run workspace.
@@ -265,6 +310,29 @@ class CodexSwarmClient:
         response.raise_for_status()
         return response.content
 
+    def download_file(self, run_id: str, path: str, dest: str | Path) -> int:
+        """
+        Stream a workspace file to disk without holding it in memory.
+
+        Args:
+            run_id: Run identifier
+            path: Workspace-relative file path
+            dest: Local file to write
+
+        Returns:
+            Number of bytes written
+
+        Raises:
+            httpx.HTTPStatusError: On API errors (404 if not found, 403 if path traversal)
+        """
+        written = 0
+        with self.client.stream("GET", f"/runs/{run_id}/workspace/files/{path}") as response:
+            response.raise_for_status()
+            with open(dest, "wb") as fh:
+                for chunk in response.iter_bytes(1 << 20):
+                    written += fh.write(chunk)
+        return written
+
     def get_file_text(self, run_id: str, path: str, encoding: str = "utf-8") -> str:
         """
         Download text file from run workspace.
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import shutil
 import signal
@@ -12,20 +13,35 @@ from pathlib import Path
 import httpx
 import pytest
 
+try:
+    import uvloop  # type: ignore
+except ImportError:
+    uvloop = None
+
 REPO_ROOT = Path(__file__).resolve().parents[1]
 
 
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run async tests on uvloop when it is installed (it ships with uvicorn[standard])."""
+    if uvloop is None:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
 def _wait_for_health(url: str, timeout: float = 30.0) -> None:
     start = time.time()
-    while time.time() - start < timeout:
-        try:
-            resp = httpx.get(url, timeout=1.0)
-            if resp.status_code == 200:
-                return
-        except httpx.HTTPError:
-            time.sleep(0.2)
-            continue
-        time.sleep(0.2)
+    delay = 0.05
+    with httpx.Client(timeout=1.0) as client:
+        while time.time() - start < timeout:
+            try:
+                resp = client.get(url)
+                if resp.status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            time.sleep(delay)
+            delay = min(delay * 2, 0.5)
     raise RuntimeError(f"Service at {url} did not become healthy in time")
 
 
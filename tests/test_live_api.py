@@ -6,24 +6,25 @@ from pathlib import Path
 import httpx
 import pytest
 
+_FINAL_STATUSES = {"succeeded", "failed", "cancelled"}
+
 
 async def _wait_for_run(client: httpx.AsyncClient, run_id: str) -> dict:
-    for _ in range(120):
-        resp = await client.get(f"/runs/{run_id}")
+    # Unbounded: the test as a whole is under a single timeout
+    while True:
+        # Long-poll; the server answers as soon as the run finishes
+        resp = await client.get(f"/runs/{run_id}/wait", params={"timeout": 30}, timeout=35)
         resp.raise_for_status()
         body = resp.json()
-        if body["status"] in {"succeeded", "failed"}:
+        if body["status"] in _FINAL_STATUSES:
             return body
-        await asyncio.sleep(0.25)
-    raise AssertionError(f"Run {run_id} did not finish in time")
 
 
 def _workspace_path(workspace_root: Path, project_id: str, run_id: str) -> Path:
     return workspace_root / project_id / run_id
 
 
-@pytest.mark.asyncio
-async def test_run_lifecycle_and_workspace_clone(live_services: dict[str, Path]) -> None:
+async def _check_run_lifecycle_and_workspace_clone(live_services: dict[str, Path]) -> None:
     project_id = "demo"
     async with httpx.AsyncClient(base_url=live_services["api_base"], timeout=30) as client:
         # Upsert project.
@@ -49,12 +50,14 @@ async def test_run_lifecycle_and_workspace_clone(live_services: dict[str, Path])
         assert baseline_run["workspace_from_run_id"] is None
 
         # Tool step and artifact should exist for baseline run.
-        steps_resp = await client.get(f"/runs/{baseline_run['id']}/steps")
+        steps_resp, artifacts_resp = await asyncio.gather(
+            client.get(f"/runs/{baseline_run['id']}/steps"),
+            client.get(f"/runs/{baseline_run['id']}/artifacts"),
+        )
         steps_resp.raise_for_status()
         step_roles = {step["role"] for step in steps_resp.json()}
         assert "tool" in step_roles
 
-        artifacts_resp = await client.get(f"/runs/{baseline_run['id']}/artifacts")
         artifacts_resp.raise_for_status()
         artifacts = artifacts_resp.json()
         assert artifacts, "Expected Codex JSONL artifact to be registered"
@@ -63,7 +66,7 @@ async def test_run_lifecycle_and_workspace_clone(live_services: dict[str, Path])
         workspace_root = live_services["workspace_root"]
         baseline_workspace = _workspace_path(workspace_root, project_id, baseline_run["id"])
         sentinel = baseline_workspace / "sentinel.txt"
-        sentinel.write_text("baseline-state", encoding="utf-8")
+        sentinel.write_bytes(b"baseline-state")
         git_dir = baseline_workspace / ".git"
         baseline_git_exists = git_dir.exists()
 
@@ -84,12 +87,22 @@ async def test_run_lifecycle_and_workspace_clone(live_services: dict[str, Path])
 
         clone_workspace = _workspace_path(workspace_root, project_id, clone_run["id"])
         clone_sentinel = clone_workspace / "sentinel.txt"
-        assert clone_sentinel.exists(), "Clone should copy workspace files"
-        assert clone_sentinel.read_text(encoding="utf-8") == "baseline-state"
+        # Check the cloned files off the event loop while the artifacts request is in flight.
+        clone_artifacts, sentinel_exists, clone_git_exists = await asyncio.gather(
+            client.get(f"/runs/{clone_run['id']}/artifacts"),
+            asyncio.to_thread(clone_sentinel.exists),
+            asyncio.to_thread((clone_workspace / ".git").exists),
+        )
+        assert sentinel_exists, "Clone should copy workspace files"
+        assert clone_sentinel.read_bytes() == b"baseline-state"
         if baseline_git_exists:
-            assert (clone_workspace / ".git").exists(), ".git should be carried over during cloning"
+            assert clone_git_exists, ".git should be carried over during cloning"
 
         # Ensure artifacts are still persisted for cloned run.
-        clone_artifacts = await client.get(f"/runs/{clone_run['id']}/artifacts")
         clone_artifacts.raise_for_status()
         assert clone_artifacts.json(), "Clone run should still emit Codex JSONL artifacts"
+
+
+@pytest.mark.asyncio
+async def test_run_lifecycle_and_workspace_clone(live_services: dict[str, Path]) -> None:
+    await asyncio.wait_for(_check_run_lifecycle_and_workspace_clone(live_services), timeout=60)
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+from app.services import machine_summary
+
+
+def test_workspace_outputs_are_sorted_and_skip_internals(tmp_path: Path) -> None:
+    for rel in ("b.md", "a/z.txt", "a.md", "a-b/c.csv", ".hidden.md", ".git/notes.md", "x.py"):
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x", encoding="utf-8")
+
+    outputs = list(machine_summary._iter_workspace_outputs(tmp_path))
+    assert outputs == ["a-b/c.csv", "a.md", "a/z.txt", "b.md"]
+
+
+def _full_parse_first_item(payload: str) -> Any:
+    try:
+        items = json.loads(payload)
+    except json.JSONDecodeError:
+        return None
+    return items[0] if isinstance(items, list) and items else None
+
+
+def test_first_list_item_matches_full_parse_for_large_payloads() -> None:
+    pad = "x" * machine_summary._STREAM_PARSE_MIN_CHARS
+    payloads = [
+        f'[{{"error_type": "a", "message": "{pad}"}}]',
+        f'[1.5, "{pad}"]',
+        f'[null, "{pad}"]',
+        f'{{"item": {{"error_type": "a"}}, "pad": "{pad}"}}',
+        f'[{{"error_type": "a"}}, "{pad}"',
+        f'[{{"error_type": "a"}}, "{pad}"] garbage',
+        f'"{pad}"',
+    ]
+    for payload in payloads:
+        assert machine_summary._first_list_item(payload) == _full_parse_first_item(payload)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import random
+import re
+
+import pytest
+
+from app.services.patterns.extractors import _hyperscan, code, data, document, research, writing
+from app.services.patterns.extractors.base import PatternScanner
+
+_MODULES = (code, data, document, research, writing)
+_ALPHABET = "abcdefghijklmnopqrstuvwxyz0123456789 -_./:,\t\n\x1c\x1féü→" + "ABCXYZ"
+_WORDS = (
+    "replace", "with", "contents", "from", "to", "through", "notes.md", "src/app.py", "A-1",
+    "B-12", "filter", "by", "bar", "chart", "csv:", "columns:", "median", "convert", "into",
+    "each", "template:", "input", "output", "folder:", "[3]", "(Smith,", "2021)", "https://x.io",
+    "search", "for:", "paper:", "topic:", "tone:", "audience:", "structure:", "500", "words",
+    "style:", "report", "Résumé", "naïve", "ǅ", "K", "replace a with b", "A-1 to B-2",
+    "bar chart", "convert md to pdf", "input folder: in", "output folder: out",
+    "source directory:\x1cx", "300 words",
+)
+
+
+def _corpus() -> list[str]:
+    rng = random.Random(20240501)
+    texts = ["", "\x1c", "é", "replace x\x1cwith y", "FILE-1 to FILE-9 and notes.md"]
+    for _ in range(400):
+        parts = []
+        for _ in range(rng.randint(1, 12)):
+            if rng.random() < 0.6:
+                parts.append(rng.choice(_WORDS))
+            else:
+                parts.append("".join(rng.choice(_ALPHABET) for _ in range(rng.randint(1, 8))))
+        texts.append(rng.choice((" ", "\x1c", " é ", "\n")).join(parts))
+    return texts
+
+
+def _patterns(module: object) -> dict[str, re.Pattern[str]]:
+    return module._SCANNER._patterns  # type: ignore[attr-defined]
+
+
+def _backends() -> list[str]:
+    backends = ["re"]
+    if _hyperscan.hyperscan is not None:
+        backends.append("hyperscan")
+    return backends
+
+
+@pytest.mark.parametrize("backend", _backends())
+@pytest.mark.parametrize("module", _MODULES, ids=lambda module: module.__name__.rsplit(".", 1)[1])
+def test_first_matches_equals_each_search(
+    module: object, backend: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    if backend == "re":
+        monkeypatch.setattr(_hyperscan, "hyperscan", None)
+    patterns = _patterns(module)
+    scanner = PatternScanner(patterns)
+    assert (scanner._hyperscan is not None) == (backend == "hyperscan")
+
+    for text in _corpus():
+        found = scanner.first_matches(text)
+        for name, pattern in patterns.items():
+            expected = pattern.search(text)
+            actual = found.get(name)
+            if expected is None:
+                assert actual is None, (name, text)
+            else:
+                assert actual is not None, (name, text)
+                assert actual.span() == expected.span(), (name, text)
+                assert actual.groups() == expected.groups(), (name, text)
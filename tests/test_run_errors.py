@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app import repositories
+from app.database import Base
+from app.models import Project, Run
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("existing", "expected_prefix"),
+    [
+        (None, []),
+        ("not json", []),
+        ('{"message": "old"}', []),
+        ('[{"message": "old"}]', [{"message": "old"}]),
+    ],
+    ids=["null", "garbage", "object", "array"],
+)
+async def test_append_run_error_starts_over_unless_history_is_an_array(
+    tmp_path: Path, existing: str | None, expected_prefix: list[dict]
+) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'runs.db'}")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        sessions = async_sessionmaker(bind=engine, expire_on_commit=False)
+        async with sessions() as session:
+            session.add(Project(id="p1", name="Project"))
+            session.add(Run(id="r1", project_id="p1", name="Run", errors_json=existing))
+            await session.commit()
+
+        record = {"message": "boom", "details": {"files": ["a.md"], "ok": False}}
+        async with sessions() as session:
+            await repositories.runs.append_run_error(session, "r1", record)
+            await session.commit()
+
+        async with sessions() as session:
+            run = await repositories.runs.get_run(session, "r1")
+            assert run is not None
+            assert run.had_errors is True
+            assert json.loads(run.errors_json) == [*expected_prefix, record]
+    finally:
+        await engine.dispose()
@@ -18,3 +18,14 @@ def test_workspace_path_sanitizes_identifiers(tmp_path: Path) -> None:
         assert "%2F" in relative.parts[0]
     finally:
         settings.workspace_root = original_root
+
+
+def test_workspace_path_keeps_dot_segments_as_names(tmp_path: Path) -> None:
+    original_root = settings.workspace_root
+    try:
+        settings.workspace_root = tmp_path
+        path = run_service._workspace_path("..", ".")
+        assert path.parent.parent == tmp_path
+        assert path.relative_to(tmp_path).parts == ("%2E%2E", "%2E")
+    finally:
+        settings.workspace_root = original_root